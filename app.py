@@ -1,13 +1,17 @@
 import streamlit as st
-from PyPDF2 import PdfReader
-from docx import Document
-import io
-import pandas as pd
 
 from data_sources import collect_jobs
 from matching import compute_matches
-from feedback import init_db, save_feedback, get_feedback_examples
+from feedback import init_db, save_feedback, get_feedback_examples, iter_feedback_rows
 from llm_matcher import llm_fit_score
+from utils import (
+    EXPORT_COLUMNS,
+    extract_cv_text,
+    iter_csv_chunks,
+    iter_jsonl_chunks,
+    spool_chunks,
+    spool_columnar,
+)
 
 init_db()
 
@@ -31,25 +35,13 @@ cv_text = ""
 
 if cv_file:
 
-    file_type = cv_file.name.lower()
-
-    # --- PDF Extraction ---
-    if file_type.endswith(".pdf"):
-        try:
-            reader = PdfReader(io.BytesIO(cv_file.read()))
-            cv_text = " ".join([page.extract_text() or "" for page in reader.pages])
-        except Exception as e:
-            st.error("❌ Could not extract text from PDF. Try another file.")
-            st.stop()
-
-    # --- DOCX Extraction ---
-    elif file_type.endswith(".docx"):
-        try:
-            document = Document(io.BytesIO(cv_file.read()))
-            cv_text = "\n".join([p.text for p in document.paragraphs])
-        except Exception as e:
-            st.error("❌ Could not extract text from DOCX. Try another file.")
-            st.stop()
+    kind = "PDF" if cv_file.name.lower().endswith(".pdf") else "DOCX"
+
+    try:
+        cv_text = extract_cv_text(cv_file.read(), cv_file.name)
+    except Exception as e:
+        st.error(f"❌ Could not extract text from {kind}. Try another file.")
+        st.stop()
 
     if not cv_text.strip():
         st.error("⚠️ Could not extract readable text from the file.")
@@ -76,6 +68,14 @@ keywords = st.text_input(
     value="HR Director OR Head of HR OR HR Leadership"
 )
 
+extra_exports = st.multiselect(
+    "Extra export formats",
+    ["JSONL", "Parquet (with embeddings)"],
+    default=[],
+    help="CSV is always offered. Parquet keeps job embeddings, which costs memory.",
+)
+with_parquet = "Parquet (with embeddings)" in extra_exports
+
 run_search = st.button("🔍 Find Matching Jobs")
 
 
@@ -99,7 +99,7 @@ if run_search:
 
     st.success(f"📥 Retrieved {len(jobs)} jobs. Computing match scores...")
 
-    results = compute_matches(cv_text, jobs)
+    results = compute_matches(cv_text, jobs, with_embeddings=with_parquet)
 
     if not results:
         st.warning("No strong matches found.")
@@ -112,37 +112,25 @@ if run_search:
 
     st.subheader("🎯 Top Matching Jobs")
 
-    df = pd.DataFrame(results)
-    df_sorted = df.sort_values(by="score", ascending=False)
-
-    for idx, row in df_sorted.iterrows():
-        job_dict = {
-            "title": row["title"],
-            "company": row["company"],
-            "source": row["source"],
-            "location": row["location"],
-            "url": row["url"],
-            "score": row["score"],
-            "snippet": row["snippet"],
-        }
-
-        with st.expander(f"{row['score']}% — {row['title']} at {row['company']}"):
-            st.write(f"**Source:** {row['source']}")
-            st.write(f"**Location:** {row['location']}")
-            st.write(f"**Description:**\n{row['snippet']}")
-            st.markdown(f"[📩 Apply Here]({row['url']})")
+    # Results are already sorted by score; each match is used as-is.
+    for idx, match in enumerate(results):
+        with st.expander(f"{match['score']}% — {match['title']} at {match['company']}"):
+            st.write(f"**Source:** {match['source']}")
+            st.write(f"**Location:** {match['location']}")
+            st.write(f"**Description:**\n{match['snippet']}")
+            st.markdown(f"[📩 Apply Here]({match['url']})")
 
             col1, col2, col3 = st.columns([1, 1, 3])
 
             # Thumbs up / down feedback
             with col1:
                 if st.button("👍 Relevant", key=f"up_{idx}"):
-                    save_feedback(job_dict, feedback=1)
+                    save_feedback(match, feedback=1)
                     st.success("Thanks! Marked as relevant.")
 
             with col2:
                 if st.button("👎 Not relevant", key=f"down_{idx}"):
-                    save_feedback(job_dict, feedback=-1)
+                    save_feedback(match, feedback=-1)
                     st.info("Marked as not relevant.")
 
             # LLM fit scoring using feedback
@@ -150,7 +138,7 @@ if run_search:
                 if st.button("🤖 LLM Fit (beta)", key=f"llm_{idx}"):
                     liked, disliked = get_feedback_examples()
                     try:
-                        result = llm_fit_score(cv_text, job_dict["snippet"], liked, disliked)
+                        result = llm_fit_score(cv_text, match["snippet"], liked, disliked)
                         if result.get("score") is not None:
                             st.write(f"**LLM Fit Score:** {result['score']}/100")
                         if result.get("summary"):
@@ -163,20 +151,68 @@ if run_search:
                             st.write("**Gaps / Risks:**")
                             for g in result["gaps"]:
                                 st.write(f"- {g}")
+                        usage = result.get("usage") or {}
+                        if usage.get("input_tokens") is not None:
+                            st.caption(
+                                f"Tokens: {usage['input_tokens']} in / "
+                                f"{usage.get('output_tokens', 0)} out"
+                            )
                     except Exception as e:
                         st.error(
                             "LLM scoring failed. Check your OPENAI_API_KEY in Streamlit secrets."
                         )
 
 
-    # Download all results
+    # Download all results. Exports are generated chunk by chunk into a
+    # temp file, but st.download_button reads the whole file into memory,
+    # so only the generation step is bounded, not the download itself.
     st.subheader("📥 Export Results")
-    csv_data = df_sorted.to_csv(index=False)
-    st.download_button(
-        "Download CSV of Matches",
-        csv_data,
-        file_name="job_matches.csv",
-        mime="text/csv",
-    )
+    export_cols = st.columns(3)
+
+    with export_cols[0]:
+        with spool_chunks(iter_csv_chunks(results, columns=EXPORT_COLUMNS)) as fh:
+            st.download_button(
+                "Download CSV of Matches",
+                fh,
+                file_name="job_matches.csv",
+                mime="text/csv",
+            )
+
+    if "JSONL" in extra_exports:
+        with export_cols[1]:
+            with spool_chunks(iter_jsonl_chunks(results, columns=EXPORT_COLUMNS)) as fh:
+                st.download_button(
+                    "Download JSONL of Matches",
+                    fh,
+                    file_name="job_matches.jsonl",
+                    mime="application/x-ndjson",
+                )
+
+    if with_parquet:
+        with export_cols[2]:
+            try:
+                parquet_file = spool_columnar(results, fmt="parquet")
+            except RuntimeError as e:
+                st.caption(str(e))
+            else:
+                with parquet_file as fh:
+                    st.download_button(
+                        "Download Parquet (with embeddings)",
+                        fh,
+                        file_name="job_matches.parquet",
+                        mime="application/vnd.apache.parquet",
+                    )
+
 
+# ---------------------------------------------------------
+# 5. Export full feedback history
+# ---------------------------------------------------------
 
+if st.checkbox("📚 Prepare feedback history export"):
+    with spool_chunks(iter_csv_chunks(iter_feedback_rows())) as fh:
+        st.download_button(
+            "Download Feedback History (CSV)",
+            fh,
+            file_name="feedback_history.csv",
+            mime="text/csv",
+        )
@@ -0,0 +1,105 @@
+"""Command-line batch matching: many CVs against one shared job search.
+
+Example:
+    python batch_match.py cvs/alice.pdf cvs/bob.docx \
+        --countries Germany Netherlands --out results/
+"""
+
+import argparse
+import os
+
+from data_sources import collect_jobs
+from matching import compute_batch_matches
+from utils import (
+    EXPORT_COLUMNS,
+    export_columnar,
+    extract_cv_text,
+    iter_csv_chunks,
+    iter_jsonl_chunks,
+)
+
+DEFAULT_KEYWORDS = "HR Director OR Head of HR OR HR Leadership"
+DEFAULT_COUNTRIES = ["Germany", "Netherlands", "UK"]
+
+
+def _parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Rank one shared job search against several CVs."
+    )
+    parser.add_argument("cvs", nargs="+", help="CV files (.pdf, .docx or .txt)")
+    parser.add_argument("--keywords", default=DEFAULT_KEYWORDS)
+    parser.add_argument("--countries", nargs="+", default=DEFAULT_COUNTRIES)
+    parser.add_argument("--threshold", type=float, default=0.30)
+    parser.add_argument(
+        "--out", default="batch_results", help="Directory for per-CV result files"
+    )
+    parser.add_argument(
+        "--format",
+        choices=["csv", "jsonl", "parquet", "feather"],
+        default="csv",
+        help="parquet/feather also store job embeddings",
+    )
+    return parser.parse_args(argv)
+
+
+def _unique_name(path, taken):
+    """Output name for a CV: file stem, plus extension/counter on clashes."""
+    stem, ext = os.path.splitext(os.path.basename(path))
+    name = stem
+    if name in taken:
+        name = f"{stem}_{ext.lstrip('.')}" if ext else stem
+    n = 2
+    base = name
+    while name in taken:
+        name = f"{base}_{n}"
+        n += 1
+    return name
+
+
+def main(argv=None):
+    args = _parse_args(argv)
+
+    names = []
+    cv_texts = []
+    for path in args.cvs:
+        try:
+            with open(path, "rb") as fh:
+                text = extract_cv_text(fh.read(), path)
+        except Exception as e:
+            print(f"Skipping {path}: {e}")
+            continue
+        if not text.strip():
+            print(f"Skipping {path}: no readable text.")
+            continue
+        names.append(_unique_name(path, names))
+        cv_texts.append(text)
+
+    if not cv_texts:
+        print("No usable CVs given.")
+        return 1
+
+    jobs = collect_jobs(args.keywords, args.countries)
+    print(f"Retrieved {len(jobs)} jobs for {len(cv_texts)} CVs.")
+
+    columnar = args.format in ("parquet", "feather")
+    all_results = compute_batch_matches(
+        cv_texts, jobs, threshold=args.threshold, with_embeddings=columnar
+    )
+
+    os.makedirs(args.out, exist_ok=True)
+    for name, results in zip(names, all_results):
+        out_path = os.path.join(args.out, f"{name}_matches.{args.format}")
+        if columnar:
+            export_columnar(results, out_path, fmt=args.format)
+        else:
+            chunks = iter_csv_chunks if args.format == "csv" else iter_jsonl_chunks
+            with open(out_path, "wb") as fh:
+                for chunk in chunks(results, columns=EXPORT_COLUMNS):
+                    fh.write(chunk)
+        print(f"{name}: {len(results)} matches -> {out_path}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
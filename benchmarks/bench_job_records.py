@@ -0,0 +1,111 @@
+"""Memory/throughput: dict job pipeline vs JobRecord/MatchRecord pipeline.
+
+Replays the per-stage hops with synthetic postings (no network, no model):
+    source -> page annotation -> match results -> per-row job dict
+
+Usage:
+    python benchmarks/bench_job_records.py [n_postings]
+"""
+
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from job_records import JobRecord, MatchRecord  # noqa: E402
+
+SOURCES = ["arbeitnow", "indeed", "eures", "reed", "englishjobs.de"]
+COMPANIES = [f"Company {i}" for i in range(500)]
+LOCATIONS = ["Berlin", "Munich", "Amsterdam", "London", "Dublin", "Madrid", "Lisbon"]
+
+
+def _raw_postings(n):
+    """Raw API-style fields; strings are rebuilt per posting, as parsing would."""
+    rng = random.Random(0)
+    for i in range(n):
+        yield (
+            "".join(rng.choice(SOURCES)),
+            f"Head of HR #{i}",
+            "".join(rng.choice(COMPANIES)),
+            "".join(rng.choice(LOCATIONS)),
+            f"https://example.com/jobs/{i}",
+            f"People leadership role number {i}. " * 8,
+        )
+
+
+def dict_pipeline(n):
+    jobs = [
+        {
+            "source": s, "title": t, "company": c,
+            "location": l, "url": u, "description": d,
+        }
+        for s, t, c, l, u, d in _raw_postings(n)
+    ]
+    page_jobs = [
+        {
+            "id": str(idx),
+            "title": job.get("title", ""),
+            "company": job.get("company", ""),
+            "location": job.get("location", "Unknown"),
+            "url": job.get("url", ""),
+            "source": job.get("source", "Unknown"),
+            "snippet": job["description"][:320],
+        }
+        for idx, job in enumerate(jobs)
+    ]
+    results = [
+        {
+            "title": job.get("title", "Unknown"),
+            "company": job.get("company", "N/A"),
+            "source": job.get("source", "Unknown"),
+            "location": job.get("location", ""),
+            "url": job.get("url", ""),
+            "score": 50.0,
+            "snippet": job["description"].replace("\n", " ")[:300],
+        }
+        for job in jobs
+    ]
+    rows = [dict(r) for r in results]
+    return jobs, page_jobs, results, rows
+
+
+def record_pipeline(n):
+    jobs = [JobRecord(*raw) for raw in _raw_postings(n)]
+    for idx, job in enumerate(jobs):
+        job.id = str(idx)
+        job.snippet = job.description[:320]
+    results = [
+        MatchRecord(job, 50.0, job.description.replace("\n", " ")[:300])
+        for job in jobs
+    ]
+    rows = results
+    return jobs, results, rows
+
+
+def _measure(fn, n):
+    tracemalloc.start()
+    start = time.perf_counter()
+    kept = fn(n)
+    elapsed = time.perf_counter() - start
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed, current, peak
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{n} postings")
+    print(f"{'pipeline':<10} {'time (s)':>10} {'retained (MB)':>15} {'peak (MB)':>11}")
+    for name, fn in (("dict", dict_pipeline), ("records", record_pipeline)):
+        elapsed, current, peak = _measure(fn, n)
+        print(
+            f"{name:<10} {elapsed:>10.2f} {current / 1e6:>15.1f} {peak / 1e6:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
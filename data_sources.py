@@ -1,7 +1,13 @@
 import requests
 import feedparser
 from bs4 import BeautifulSoup
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import source_health
+from job_records import JobRecord
 
 
 # ---------------------------------------------------------
@@ -9,33 +15,215 @@ import time
 # ---------------------------------------------------------
 
 def normalize_job(source, title, company, location, url, description):
-    return {
-        "source": source or "",
-        "title": title or "",
-        "company": company or "",
-        "location": location or "",
-        "url": url or "",
-        "description": description or "",
-    }
+    return JobRecord(
+        source or "",
+        title or "",
+        company or "",
+        location or "",
+        url or "",
+        description or "",
+    )
+
+
+# ---------------------------------------------------------
+# Paginated fetching (shared by all sources)
+# ---------------------------------------------------------
+
+DEFAULT_MAX_PAGES = 5  # page budget per source per crawl
+PER_HOST_LIMIT = 4  # max concurrent requests to one host
+HOST_LIMIT_OVERRIDES = {"englishjobs.de": 1}
+MAX_CACHED_POSTINGS = 1000  # per source query
+CACHE_TTL_SECONDS = 12 * 3600  # drop cached postings not seen for this long
+
+_host_semaphores = {}
+_host_lock = threading.Lock()
+
+# Postings from earlier crawls, keyed by source query, newest first,
+# as (job, last_seen) pairs.
+_crawl_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _host_of(url):
+    host = urlparse(url).netloc.lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def _host_limit(url):
+    return HOST_LIMIT_OVERRIDES.get(_host_of(url), PER_HOST_LIMIT)
+
+
+def _host_semaphore(url):
+    host = _host_of(url)
+    with _host_lock:
+        if host not in _host_semaphores:
+            _host_semaphores[host] = threading.BoundedSemaphore(_host_limit(url))
+        return _host_semaphores[host]
+
+
+def _http_get(url, headers=None, delay=0):
+    """GET a URL while holding that host's concurrency slot."""
+    with _host_semaphore(url):
+        resp = requests.get(url, headers=headers, timeout=10)
+        if delay:
+            time.sleep(delay)  # ethical delay, keeps the slot busy
+        return resp
+
+
+def _posting_key(job):
+    if job.get("url"):
+        return job["url"]
+    return f"{job.get('title', '')}::{job.get('company', '')}"
+
+
+class PaginatedSource:
+    """
+    A job feed that can be read page by page.
+    Subclasses implement page_url() and parse_page().
+    """
+
+    name = ""
+    headers = None
+    delay = 0
+    max_pages = None  # per-source cap on the crawl's page budget
+
+    def __init__(self, url):
+        self.url = url
+
+    @property
+    def key(self):
+        return f"{self.name}:{self.url}"
+
+    def page_url(self, page):
+        """URL of a 1-based page, or None if the feed has no such page."""
+        return self.url if page == 1 else None
+
+    def parse_page(self, resp):
+        """Return (jobs, has_next) for one fetched page."""
+        raise NotImplementedError
+
+    def fetch_page(self, page):
+        url = self.page_url(page)
+        if url is None:
+            return [], False
+
+        # Circuit open: skip instead of waiting out another timeout.
+        if not source_health.allow_request(self.name):
+            return [], False
+
+        start = time.monotonic()
+        try:
+            resp = _http_get(url, headers=self.headers, delay=self.delay)
+            latency = resp.elapsed.total_seconds()
+
+            # Any non-200 (blocked, 5xx, or a dead URL like 404/410) is a failure.
+            if resp.status_code != 200:
+                source_health.record_failure(self.name, latency, f"HTTP {resp.status_code}")
+                return [], False
+
+            result = self.parse_page(resp)
+            source_health.record_success(self.name, latency)
+        except Exception as e:
+            source_health.record_failure(self.name, time.monotonic() - start, str(e))
+            print(f"{self.name} error (page {page}):", e)
+            return [], False
+
+        return result
+
+
+def crawl_source(source, max_pages=DEFAULT_MAX_PAGES):
+    """
+    Fetch up to max_pages pages of a source, several at a time.
+    Stops at the first page containing a posting already seen in an
+    earlier crawl, and returns new postings followed by cached ones.
+    Cached postings not seen for CACHE_TTL_SECONDS are dropped.
+    """
+
+    if source.max_pages is not None:
+        max_pages = min(max_pages, source.max_pages)
+
+    now = time.time()
+    with _cache_lock:
+        cached = [
+            (job, last_seen)
+            for job, last_seen in _crawl_cache.get(source.key, [])
+            if now - last_seen < CACHE_TTL_SECONDS
+        ]
+
+    cached_keys = {_posting_key(job) for job, _ in cached}
+    seen = set(cached_keys)
+    refreshed = set()
+    new_jobs = []
+    limit = _host_limit(source.url)
+    page = 1
+    size = 1  # page 1 alone, then 2, 4, ... up to the host limit
+    done = False
+
+    with ThreadPoolExecutor(max_workers=limit) as pool:
+        while not done and page <= max_pages:
+            batch = list(range(page, min(page + size, max_pages + 1)))
+            futures = [pool.submit(source.fetch_page, p) for p in batch]
+
+            for future in futures:
+                jobs, has_next = future.result()
+                reached_seen = False
+                for job in jobs:
+                    key = _posting_key(job)
+                    if key in cached_keys:
+                        refreshed.add(key)
+                    if key in seen:
+                        reached_seen = True
+                        continue
+                    seen.add(key)
+                    new_jobs.append(job)
+
+                if reached_seen or not jobs or not has_next:
+                    done = True
+                    break
+
+            # Pages queued past the stopping point are not needed.
+            for future in futures:
+                future.cancel()
+
+            page += len(batch)
+            size = min(size * 2, limit)
+
+    merged = [(job, now) for job in new_jobs]
+    for job, last_seen in cached:
+        if _posting_key(job) in refreshed:
+            last_seen = now
+        merged.append((job, last_seen))
+    merged = merged[:MAX_CACHED_POSTINGS]
+
+    with _cache_lock:
+        _crawl_cache[source.key] = merged
+    return [job for job, _ in merged]
 
 
 # ---------------------------------------------------------
 # 1. Arbeitnow API
 # ---------------------------------------------------------
 
-def fetch_arbeitnow_jobs(keywords, location):
+class ArbeitnowSource(PaginatedSource):
     """
     https://www.arbeitnow.com/api/job-board-api
+    Follows links.next; pages are addressed with ?page=N.
     """
-    try:
-        url = f"https://www.arbeitnow.com/api/job-board-api?keywords={keywords}&location={location}"
-        resp = requests.get(url, timeout=10)
 
-        if resp.status_code != 200:
-            return []
+    name = "arbeitnow"
 
+    def __init__(self, keywords, location):
+        super().__init__(
+            f"https://www.arbeitnow.com/api/job-board-api?keywords={keywords}&location={location}"
+        )
+
+    def page_url(self, page):
+        return self.url if page == 1 else f"{self.url}&page={page}"
+
+    def parse_page(self, resp):
+        payload = resp.json()
         jobs = []
-        for job in resp.json().get("data", []):
+        for job in payload.get("data", []):
             jobs.append(
                 normalize_job(
                     "arbeitnow",
@@ -46,27 +234,46 @@ def fetch_arbeitnow_jobs(keywords, location):
                     job.get("description"),
                 )
             )
-        return jobs
+        has_next = bool((payload.get("links") or {}).get("next"))
+        return jobs, has_next
+
 
-    except Exception as e:
-        print("Arbeitnow error:", e)
-        return []
+def fetch_arbeitnow_jobs(keywords, location, max_pages=DEFAULT_MAX_PAGES):
+    return crawl_source(ArbeitnowSource(keywords, location), max_pages)
 
 
 # ---------------------------------------------------------
 # 2. Generic RSS fetcher
 # ---------------------------------------------------------
 
-def fetch_rss_jobs(url, source_name):
-    try:
-        feed = feedparser.parse(url)
+class RSSSource(PaginatedSource):
+    """
+    RSS/Atom feed. Feeds that support paging take an offset parameter
+    (e.g. Indeed's start=0,10,20...); others are read as a single page.
+    """
+
+    def __init__(self, url, source_name, page_param=None, page_step=10):
+        super().__init__(url)
+        self.name = source_name
+        self.page_param = page_param
+        self.page_step = page_step
+
+    def page_url(self, page):
+        if page == 1:
+            return self.url
+        if not self.page_param:
+            return None
+        return f"{self.url}&{self.page_param}={(page - 1) * self.page_step}"
+
+    def parse_page(self, resp):
+        feed = feedparser.parse(resp.content)
         jobs = []
-        for entry in feed.entries[:40]:
+        for entry in feed.entries:
             desc = getattr(entry, "summary", getattr(entry, "description", ""))
 
             jobs.append(
                 normalize_job(
-                    source_name,
+                    self.name,
                     getattr(entry, "title", ""),
                     getattr(entry, "author", "Unknown"),
                     "",
@@ -74,26 +281,34 @@ def fetch_rss_jobs(url, source_name):
                     desc,
                 )
             )
-        return jobs
-    except Exception as e:
-        print(f"RSS error ({source_name}):", e)
-        return []
+        return jobs, bool(self.page_param)
+
+
+def fetch_rss_jobs(url, source_name, page_param=None, max_pages=DEFAULT_MAX_PAGES):
+    return crawl_source(RSSSource(url, source_name, page_param), max_pages)
 
 
 # ---------------------------------------------------------
 # 3. englishjobs.de scraper (ethical)
 # ---------------------------------------------------------
 
-def scrape_englishjobs(keyword="HR"):
-    try:
-        url = f"https://englishjobs.de/jobs/{keyword.lower()}"
-        headers = {"User-Agent": "Mozilla/5.0"}
+class EnglishJobsSource(PaginatedSource):
+    name = "englishjobs.de"
+    headers = {"User-Agent": "Mozilla/5.0"}
+    delay = 5  # ethical delay between requests
+    max_pages = 2  # with the delay and one slot, each page costs 5s
 
-        resp = requests.get(url, headers=headers, timeout=10)
+    def __init__(self, keyword="HR"):
+        super().__init__(f"https://englishjobs.de/jobs/{keyword.lower()}")
+
+    def page_url(self, page):
+        return self.url if page == 1 else f"{self.url}?page={page}"
+
+    def parse_page(self, resp):
         soup = BeautifulSoup(resp.text, "html.parser")
 
         jobs = []
-        for item in soup.find_all("div", class_="job-item")[:10]:
+        for item in soup.find_all("div", class_="job-item"):
             title = item.find("h3").text.strip() if item.find("h3") else "HR Job"
             link = item.find("a")["href"] if item.find("a") else ""
 
@@ -107,53 +322,58 @@ def scrape_englishjobs(keyword="HR"):
                     "HR / leadership role",
                 )
             )
+        return jobs, bool(jobs)
 
-        time.sleep(5)  # ethical delay
-        return jobs
 
-    except Exception as e:
-        print("englishjobs.de error:", e)
-        return []
+def scrape_englishjobs(keyword="HR", max_pages=DEFAULT_MAX_PAGES):
+    return crawl_source(EnglishJobsSource(keyword), max_pages)
 
 
 # ---------------------------------------------------------
 # 4. MASTER FUNCTION — collects all jobs
 # ---------------------------------------------------------
 
-def collect_jobs(keywords, countries):
+def collect_jobs(keywords, countries, max_pages=DEFAULT_MAX_PAGES):
     """
     Main unified job source loader
-    Returns a combined list of job dicts
+    Returns a combined list of JobRecord objects
     """
 
-    all_jobs = []
-
     kw = keywords.replace(" ", "+")
 
+    sources = []
+
     # Arbeitnow (only works for certain countries)
     for c in countries:
         if c in ["Germany", "Netherlands", "Spain", "Portugal"]:
-            all_jobs.extend(fetch_arbeitnow_jobs(kw, c))
+            sources.append(ArbeitnowSource(kw, c))
 
     # Reed (UK)
     if "UK" in countries or "United Kingdom" in countries:
         reed_url = "https://www.reed.co.uk/rss/jobs?keywords=HR+Leadership&location=London"
-        all_jobs.extend(fetch_rss_jobs(reed_url, "reed"))
+        sources.append(RSSSource(reed_url, "reed"))
 
-    # Indeed (global RSS)
+    # Indeed (global RSS, paged with start=)
     for c in countries:
         indeed_url = f"https://www.indeed.com/rss?q={kw}&l={c}"
-        all_jobs.extend(fetch_rss_jobs(indeed_url, "indeed"))
+        sources.append(RSSSource(indeed_url, "indeed", page_param="start"))
 
     # EURES (EU)
     for c in countries:
         cc = c[:2].upper()
         eures_url = f"https://ec.europa.eu/eures/public/rss?keywords=HR&country={cc}"
-        all_jobs.extend(fetch_rss_jobs(eures_url, "eures"))
+        sources.append(RSSSource(eures_url, "eures"))
 
     # englishjobs.de
     if "Germany" in countries:
-        all_jobs.extend(scrape_englishjobs("HR"))
+        sources.append(EnglishJobsSource("HR"))
+
+    # Crawl all sources at once; per-host limits still apply.
+    all_jobs = []
+    if sources:
+        with ThreadPoolExecutor(max_workers=len(sources)) as pool:
+            for jobs in pool.map(lambda src: crawl_source(src, max_pages), sources):
+                all_jobs.extend(jobs)
 
     print(f"[DEBUG] Arbeitnow jobs: {len([j for j in all_jobs if j['source']=='arbeitnow'])}")
     print(f"[DEBUG] Reed jobs: {len([j for j in all_jobs if j['source']=='reed'])}")
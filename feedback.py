@@ -1,16 +1,36 @@
 import sqlite3
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 DB_PATH = "feedback.db"
 
+# Dimensions kept in feedback_agg, with the SQL expression for each
+# ({row} is NEW/OLD inside triggers, the table name when rebuilding).
+AGG_DIMENSIONS = {
+    "source": "COALESCE({row}.source, '')",
+    "company": "COALESCE({row}.company, '')",
+    "location": "COALESCE({row}.location, '')",
+    # 0, 10, ... 90 (100 goes into 90). Votes without a match score are
+    # 'unscored': NULL now, 0.0 in older rows (real matches never score 0).
+    "score_bucket": (
+        "CASE WHEN {row}.emb_score IS NULL OR {row}.emb_score = 0 THEN 'unscored' ELSE "
+        "CAST(MAX(0, MIN(9, CAST({row}.emb_score / 10 AS INTEGER))) * 10 AS TEXT) END"
+    ),
+}
+
+# Bump when AGG_DIMENSIONS changes; init_db then rebuilds the aggregates.
+AGG_SCHEMA_VERSION = 2
+
+# get_feedback_examples() results by limit; cleared on every save.
+_examples_cache: Dict[int, Tuple[List[str], List[str]]] = {}
+
 
 def _get_conn():
     return sqlite3.connect(DB_PATH, check_same_thread=False)
 
 
 def init_db():
-    """Create the feedback table if it does not exist."""
+    """Create the feedback and aggregate tables if they do not exist."""
     conn = _get_conn()
     cur = conn.cursor()
     cur.execute(
@@ -28,10 +48,126 @@ def init_db():
         );
         """
     )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS feedback_agg (
+            dimension TEXT,
+            value TEXT,
+            likes INTEGER NOT NULL DEFAULT 0,
+            dislikes INTEGER NOT NULL DEFAULT 0,
+            PRIMARY KEY (dimension, value)
+        );
+        """
+    )
+
+    version = cur.execute("PRAGMA user_version").fetchone()[0]
+    needs_rebuild = version < AGG_SCHEMA_VERSION
+    if needs_rebuild:
+        cur.execute("DROP TRIGGER IF EXISTS feedback_agg_insert")
+        cur.execute("DROP TRIGGER IF EXISTS feedback_agg_delete")
+    _create_agg_triggers(cur)
+    cur.execute(f"PRAGMA user_version = {AGG_SCHEMA_VERSION}")
+    conn.commit()
+    conn.close()
+
+    # Existing history from before the aggregates (or this layout) existed
+    if needs_rebuild:
+        rebuild_aggregates()
+
+
+# ---------------------------------------------------------
+# Aggregates: like/dislike counts per dimension value,
+# maintained by triggers on every insert/delete
+# ---------------------------------------------------------
+
+def _create_agg_triggers(cur):
+    inserts = []
+    deletes = []
+    for dim, expr in AGG_DIMENSIONS.items():
+        inserts.append(
+            f"""
+            INSERT INTO feedback_agg (dimension, value, likes, dislikes)
+            VALUES ('{dim}', {expr.format(row="NEW")}, NEW.feedback = 1, NEW.feedback = -1)
+            ON CONFLICT (dimension, value) DO UPDATE SET
+                likes = likes + excluded.likes,
+                dislikes = dislikes + excluded.dislikes;
+            """
+        )
+        deletes.append(
+            f"""
+            UPDATE feedback_agg SET
+                likes = likes - (OLD.feedback = 1),
+                dislikes = dislikes - (OLD.feedback = -1)
+            WHERE dimension = '{dim}' AND value = {expr.format(row="OLD")};
+            """
+        )
+
+    cur.execute(
+        "CREATE TRIGGER IF NOT EXISTS feedback_agg_insert AFTER INSERT ON feedback "
+        f"BEGIN {''.join(inserts)} END;"
+    )
+    cur.execute(
+        "CREATE TRIGGER IF NOT EXISTS feedback_agg_delete AFTER DELETE ON feedback "
+        f"BEGIN {''.join(deletes)} END;"
+    )
+
+
+def rebuild_aggregates():
+    """Recompute feedback_agg from the full feedback table (one-off scan)."""
+    conn = _get_conn()
+    cur = conn.cursor()
+    cur.execute("DELETE FROM feedback_agg")
+    for dim, expr in AGG_DIMENSIONS.items():
+        value = expr.format(row="feedback")
+        cur.execute(
+            f"""
+            INSERT INTO feedback_agg (dimension, value, likes, dislikes)
+            SELECT '{dim}', {value}, SUM(feedback = 1), SUM(feedback = -1)
+            FROM feedback
+            GROUP BY {value}
+            """
+        )
     conn.commit()
     conn.close()
 
 
+def _like_rate_row(value, likes, dislikes):
+    total = likes + dislikes
+    return {
+        "value": value,
+        "likes": likes,
+        "dislikes": dislikes,
+        "total": total,
+        "like_rate": likes / total if total else None,
+    }
+
+
+def get_like_rates(dimension: str, min_votes: int = 1, limit: int = 20) -> List[Dict]:
+    """
+    Like counts and rate per value of one dimension
+    (source, company, location or score_bucket), most-voted first.
+    """
+    if dimension not in AGG_DIMENSIONS:
+        raise ValueError(f"Unknown feedback dimension: {dimension}")
+
+    conn = _get_conn()
+    cur = conn.cursor()
+    cur.execute(
+        """
+        SELECT value, likes, dislikes
+        FROM feedback_agg
+        WHERE dimension = ? AND likes + dislikes >= ?
+        ORDER BY likes + dislikes DESC, value
+        LIMIT ?
+        """,
+        (dimension, min_votes, limit),
+    )
+    rows = cur.fetchall()
+    conn.close()
+
+    return [_like_rate_row(*row) for row in rows]
+
+
 def save_feedback(job: Dict, feedback: int):
     """Save user feedback: +1 relevant, -1 irrelevant."""
     conn = _get_conn()
@@ -47,13 +183,14 @@ def save_feedback(job: Dict, feedback: int):
             job.get("source", ""),
             job.get("location", ""),
             job.get("url", ""),
-            float(job.get("score", 0.0)),
+            float(job["score"]) if job.get("score") is not None else None,
             int(feedback),
             datetime.utcnow().isoformat(),
         ),
     )
     conn.commit()
     conn.close()
+    _examples_cache.clear()
 
 
 def get_feedback_examples(limit: int = 3) -> Tuple[List[str], List[str]]:
@@ -61,7 +198,11 @@ def get_feedback_examples(limit: int = 3) -> Tuple[List[str], List[str]]:
     Return two lists:
       liked_titles    – recently liked jobs
       disliked_titles – recently disliked jobs
+    Cached in memory until the next save_feedback().
     """
+    if limit in _examples_cache:
+        return _examples_cache[limit]
+
     conn = _get_conn()
     cur = conn.cursor()
 
@@ -94,5 +235,32 @@ def get_feedback_examples(limit: int = 3) -> Tuple[List[str], List[str]]:
     liked = [f"{title} ({src})" for (title, src) in liked_rows]
     disliked = [f"{title} ({src})" for (title, src) in disliked_rows]
 
+    _examples_cache[limit] = (liked, disliked)
     return liked, disliked
 
+
+def iter_feedback_rows(batch_size: int = 500) -> Iterator[Dict]:
+    """
+    Stream the full feedback history, oldest first, as dicts.
+    Rows are fetched batch_size at a time so memory stays flat.
+    """
+    conn = _get_conn()
+    cur = conn.cursor()
+    try:
+        cur.execute(
+            """
+            SELECT id, job_title, company, source, location, url,
+                   emb_score, feedback, created_at
+            FROM feedback
+            ORDER BY id
+            """
+        )
+        columns = [d[0] for d in cur.description]
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                break
+            for row in rows:
+                yield dict(zip(columns, row))
+    finally:
+        conn.close()
@@ -0,0 +1,109 @@
+"""Compact job records shared by every pipeline stage."""
+
+import sys
+
+JOB_FIELDS = ("source", "title", "company", "location", "url", "description")
+MATCH_FIELDS = ("title", "company", "source", "location", "url", "score", "snippet")
+
+# Low-cardinality fields: the same few strings repeat across thousands of jobs.
+_INTERNED_FIELDS = ("source", "company", "location")
+
+_MISSING = object()
+
+
+class JobRecord:
+    """
+    One job posting.
+
+    Uses __slots__ instead of a per-instance dict and interns
+    source/company/location, so 100k postings share a handful of those
+    strings. get() / [] mirror the old dict interface, so sources, the
+    HR filter, feedback and exports use records as-is without copying.
+    """
+
+    __slots__ = JOB_FIELDS + ("id", "snippet")
+    _fields = frozenset(__slots__)
+
+    def __init__(self, source, title, company, location, url, description):
+        self.source = sys.intern(str(source))
+        self.title = title
+        self.company = sys.intern(str(company))
+        self.location = sys.intern(str(location))
+        self.url = url
+        self.description = description
+        self.id = ""
+        self.snippet = ""
+
+    def get(self, key, default=None):
+        if key in self._fields:
+            return getattr(self, key)
+        return default
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key not in self._fields:
+            raise KeyError(key)
+        if key in _INTERNED_FIELDS:
+            value = sys.intern(str(value))
+        setattr(self, key, value)
+
+    def __contains__(self, key):
+        return key in self._fields
+
+    def keys(self):
+        return self.__slots__
+
+    def to_dict(self):
+        return {k: getattr(self, k) for k in self.__slots__}
+
+    def __repr__(self):
+        return f"JobRecord({self.source!r}, {self.title!r}, {self.company!r})"
+
+
+class MatchRecord:
+    """
+    A job scored against one CV. Holds a reference to the shared
+    JobRecord rather than a copy of its fields.
+    """
+
+    __slots__ = ("job", "score", "snippet", "embedding")
+
+    def __init__(self, job, score, snippet, embedding=None):
+        self.job = job
+        self.score = score
+        self.snippet = snippet
+        self.embedding = embedding
+
+    def get(self, key, default=None):
+        if key == "score":
+            return self.score
+        if key == "snippet":
+            return self.snippet
+        if key == "embedding":
+            return default if self.embedding is None else self.embedding
+        return self.job.get(key, default)
+
+    def __getitem__(self, key):
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key):
+        return key in self.keys()
+
+    def keys(self):
+        if self.embedding is None:
+            return MATCH_FIELDS
+        return MATCH_FIELDS + ("embedding",)
+
+    def to_dict(self):
+        return {k: self.get(k) for k in self.keys()}
+
+    def __repr__(self):
+        return f"MatchRecord({self.score!r}, {self.job!r})"
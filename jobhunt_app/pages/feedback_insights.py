@@ -0,0 +1,49 @@
+"""Streamlit page with like-rate statistics from the feedback aggregates."""
+
+from __future__ import annotations
+
+import streamlit as st
+
+from feedback import get_like_rates, init_db
+
+DIMENSION_LABELS = {
+    "source": "📡 By source",
+    "company": "🏢 By company",
+    "location": "📍 By location",
+    "score_bucket": "🎯 By match score",
+}
+
+
+def _label(dimension: str, value: str) -> str:
+    if dimension == "score_bucket":
+        if value == "unscored":
+            return "Unscored"
+        low = int(value)
+        return f"{low}–{low + 10}%"
+    return value or "Unknown"
+
+
+init_db()
+
+st.title("📈 Feedback Insights")
+st.write("Like rates from your 👍/👎 history, read from pre-aggregated tables.")
+
+min_votes = st.slider("Minimum votes per row", 1, 20, 1)
+
+cols = st.columns(2)
+
+for i, (dimension, title) in enumerate(DIMENSION_LABELS.items()):
+    with cols[i % 2]:
+        st.markdown(f"### {title}")
+        rows = get_like_rates(dimension, min_votes=min_votes)
+
+        if not rows:
+            st.caption("No feedback yet.")
+            continue
+
+        for row in rows:
+            st.markdown(
+                f"**{_label(dimension, row['value'])}** — "
+                f"{row['like_rate']:.0%} liked "
+                f"({row['likes']} 👍 / {row['dislikes']} 👎)"
+            )
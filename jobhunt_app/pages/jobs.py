@@ -9,38 +9,39 @@ import streamlit as st
 
 from data_sources import collect_jobs
 from feedback import save_feedback as persist_feedback
+from job_records import JobRecord
+from source_health import health_snapshot
 from utils import make_snippet
 
 DEFAULT_KEYWORDS = "HR Director OR Head of HR"
 DEFAULT_COUNTRIES = ["Germany", "Netherlands", "UK"]
+HEALTH_ICONS = {"closed": "🟢", "half_open": "🟡", "open": "🔴"}
 
 
-def _job_id(job: dict, fallback: int) -> str:
-    """Create a stable identifier for a job using URL or title/company."""
-    if job.get("url"):
-        return hashlib.md5(job["url"].encode("utf-8")).hexdigest()
-    if job.get("title") and job.get("company"):
-        key = f"{job['title']}::{job['company']}"
-        return hashlib.md5(key.encode("utf-8")).hexdigest()
-    return f"job-{fallback}"
+def _job_id(job: JobRecord) -> str:
+    """Create a stable identifier for a job from its own fields only."""
+    if job.url:
+        key = job.url
+    elif job.title and job.company:
+        key = f"{job.title}::{job.company}"
+    else:
+        key = f"{job.source}::{job.title}::{job.location}::{job.description}"
+    return hashlib.md5(key.encode("utf-8")).hexdigest()
 
 
 def fetch_jobs(keywords: str, countries: List[str]):
+    """
+    Collect jobs and annotate each record in place with id and snippet.
+
+    Records are shared through the crawl cache across calls and sessions,
+    so the annotation depends only on the record itself and re-running
+    it always writes the same values.
+    """
     jobs = collect_jobs(keywords, countries)
-    normalized = []
-    for idx, job in enumerate(jobs):
-        normalized.append(
-            {
-                "id": _job_id(job, idx),
-                "title": job.get("title", ""),
-                "company": job.get("company", ""),
-                "location": job.get("location", "Unknown"),
-                "url": job.get("url", ""),
-                "source": job.get("source", "Unknown"),
-                "snippet": make_snippet(job.get("description", ""), 320),
-            }
-        )
-    return normalized
+    for job in jobs:
+        job.id = _job_id(job)
+        job.snippet = make_snippet(job.description, 320)
+    return jobs
 
 
 def render_feedback_state(job_id: str, value: str):
@@ -85,6 +86,23 @@ with right:
     for site, count in site_stats.items():
         st.markdown(f"**{site}** — {count} postings")
 
+    st.markdown("---")
+    st.markdown("### 🩺 Source Health")
+
+    for site, health in health_snapshot().items():
+        icon = HEALTH_ICONS.get(health["state"], "⚪")
+        rate = health["success_rate"]
+        rate_text = f"{rate:.0%} ok" if rate is not None else "no data"
+        line = f"{icon} **{site}** — {rate_text}"
+        if health["p50_latency"] is not None:
+            line += f", p50 {health['p50_latency']:.1f}s / p95 {health['p95_latency']:.1f}s"
+        st.markdown(line)
+        if health["state"] == "open":
+            st.caption(
+                f"Skipped for {health['cooldown_left']}s after "
+                f"{health['consecutive_failures']} failures: {health['last_error']}"
+            )
+
     st.markdown("---")
     st.caption("Updated every scrape run")
 
@@ -1,11 +1,51 @@
 import os
 import json
+import hashlib
 from openai import OpenAI
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 
 _client = None
 
+MODEL = "gpt-4.1-mini"
+DIGEST_CACHE_DIR = "cv_digests"
+
+# Rough prompt budget per fit-score call (~4 characters per token).
+MAX_PROMPT_TOKENS = 2500
+MAX_OUTPUT_TOKENS = 400
+CHARS_PER_TOKEN = 4
+
+FIT_SCORE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "score": {"type": "number"},
+        "summary": {"type": "string"},
+        "strengths": {"type": "array", "items": {"type": "string"}},
+        "gaps": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["score", "summary", "strengths", "gaps"],
+    "additionalProperties": False,
+}
+
+CV_DIGEST_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "headline": {"type": "string"},
+        "years_experience": {"type": "number"},
+        "seniority": {"type": "string"},
+        "key_skills": {"type": "array", "items": {"type": "string"}},
+        "industries": {"type": "array", "items": {"type": "string"}},
+        "languages": {"type": "array", "items": {"type": "string"}},
+        "locations": {"type": "array", "items": {"type": "string"}},
+        "achievements": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": [
+        "headline", "years_experience", "seniority", "key_skills",
+        "industries", "languages", "locations", "achievements",
+    ],
+    "additionalProperties": False,
+}
+
 
 def _get_client() -> OpenAI:
     """Return a cached OpenAI client instance."""
@@ -20,15 +60,128 @@ def _get_client() -> OpenAI:
     return _client
 
 
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate, good enough for budgeting prompts."""
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _json_request(prompt: str, schema_name: str, schema: Dict, max_tokens: int):
+    """Call the model in strict JSON-schema mode; returns (raw_text, usage)."""
+    client = _get_client()
+
+    response = client.responses.create(
+        model=MODEL,
+        input=[
+            {
+                "role": "user",
+                "content": prompt,
+            }
+        ],
+        text={
+            "format": {
+                "type": "json_schema",
+                "name": schema_name,
+                "schema": schema,
+                "strict": True,
+            }
+        },
+        max_output_tokens=max_tokens,
+    )
+
+    usage = {}
+    if getattr(response, "usage", None) is not None:
+        usage = {
+            "input_tokens": response.usage.input_tokens,
+            "output_tokens": response.usage.output_tokens,
+        }
+    return response.output_text, usage
+
+
+# ---------------------------------------------------------
+# CV digest: compact summary, built once per CV and cached
+# ---------------------------------------------------------
+
+def cv_hash(cv_text: str) -> str:
+    return hashlib.sha256(cv_text.encode("utf-8")).hexdigest()
+
+
+def get_cv_digest(cv_text: str) -> Optional[Dict]:
+    """
+    Return a structured summary of the CV, cached on disk by CV hash.
+    Only the first call for a given CV hits the LLM. Returns None if the
+    model's answer is not a usable digest (cut off, refused); the caller
+    then falls back to raw CV text. That outcome is cached too, so a CV
+    whose digest failed costs one digest request, not one per call.
+    """
+
+    path = os.path.join(DIGEST_CACHE_DIR, f"{cv_hash(cv_text)}.json")
+    failed_path = f"{path}.failed"
+
+    # A digest that failed once is not retried (delete the marker to retry).
+    if os.path.exists(failed_path):
+        return None
+
+    if os.path.exists(path):
+        try:
+            with open(path, "r", encoding="utf-8") as fh:
+                return json.load(fh)
+        except (OSError, ValueError) as e:
+            print("CV digest cache unreadable, rebuilding:", e)
+
+    prompt = f"""
+Summarise this CV for job matching. Be terse: short phrases, no sentences.
+At most 12 key_skills and 5 achievements.
+
+CV:
+\"\"\"{cv_text[:8000]}\"\"\"
+    """
+
+    raw, _ = _json_request(prompt, "cv_digest", CV_DIGEST_SCHEMA, 600)
+    try:
+        digest = json.loads(raw)
+    except (TypeError, ValueError) as e:
+        print("CV digest not valid JSON, using raw CV:", e)
+        digest = None
+
+    os.makedirs(DIGEST_CACHE_DIR, exist_ok=True)
+
+    if not isinstance(digest, dict):
+        open(failed_path, "w").close()
+        return None
+
+    # Write-then-rename so a crash never leaves a partial cache file.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as fh:
+        json.dump(digest, fh, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+    return digest
+
+
+def format_cv_digest(digest: Dict) -> str:
+    """Render a digest as the compact CV block used in prompts."""
+    lines = []
+    for key, value in digest.items():
+        if isinstance(value, list):
+            value = "; ".join(str(v) for v in value)
+        if value in ("", None):
+            continue
+        lines.append(f"{key.replace('_', ' ')}: {value}")
+    return "\n".join(lines)
+
+
 def llm_fit_score(
     cv_text: str,
     job_text: str,
     liked_examples: List[str] = None,
     disliked_examples: List[str] = None,
+    use_digest: bool = True,
 ) -> Dict:
     """
     GPT-based preference-aware fit score.
-    Returns a dict with: score, summary, strengths, gaps
+    Returns a dict with: score, summary, strengths, gaps, usage
+
+    With use_digest the CV is sent as its cached digest instead of raw text.
     """
 
     liked_examples = liked_examples or []
@@ -51,39 +204,37 @@ def llm_fit_score(
             "and HR Transformation roles.\n\n"
         )
 
+    digest = get_cv_digest(cv_text) if use_digest else None
+    if digest:
+        cv_block = format_cv_digest(digest)
+    else:
+        cv_block = cv_text[:5000]
+
+    # Give the job description whatever budget the rest of the prompt leaves.
+    fixed_tokens = estimate_tokens(cv_block) + estimate_tokens(preference_block) + 100
+    job_chars = max(500, (MAX_PROMPT_TOKENS - fixed_tokens) * CHARS_PER_TOKEN)
+    job_block = job_text[:min(job_chars, 5000)]
+
     prompt = f"""
 Evaluate the fit between this CV and job description.
 
 CV:
-\"\"\"{cv_text[:5000]}\"\"\"
+\"\"\"{cv_block}\"\"\"
 
 Job Description:
-\"\"\"{job_text[:5000]}\"\"\"
+\"\"\"{job_block}\"\"\"
 
 User preference history:
 {preference_block}
 
-Return ONLY valid JSON with fields:
-- "score": number 0-100
-- "summary": short string
-- "strengths": list of strings
-- "gaps": list of strings
+Return JSON: "score" 0-100, "summary" short string,
+"strengths" and "gaps" as lists of short strings.
     """
 
-    client = _get_client()
-
-    response = client.responses.create(
-        model="gpt-4.1-mini",
-        input=[
-            {
-                "role": "user",
-                "content": prompt,
-            }
-        ],
-    )
+    raw, usage = _json_request(prompt, "fit_score", FIT_SCORE_SCHEMA, MAX_OUTPUT_TOKENS)
+    usage["prompt_tokens_est"] = estimate_tokens(prompt)
 
     try:
-        raw = response.output[0].content[0].text
         data = json.loads(raw)
     except Exception:
         data = {
@@ -93,5 +244,5 @@ Return ONLY valid JSON with fields:
             "gaps": [],
         }
 
+    data["usage"] = usage
     return data
-
@@ -1,5 +1,8 @@
+import numpy as np
 from sentence_transformers import SentenceTransformer, util
 
+from job_records import MatchRecord
+
 
 # ---------------------------------------------------------
 # Load MPNet embedding model (high-accuracy)
@@ -19,43 +22,84 @@ def load_model():
 # Compute match scores between CV and job descriptions
 # ---------------------------------------------------------
 
-def compute_matches(cv_text, jobs, threshold=0.30):
+def compute_matches(cv_text, jobs, threshold=0.30, with_embeddings=False):
     """
     CV vs Job Description semantic similarity.
     Uses all-mpnet-base-v2 for deeper matching accuracy.
     """
 
-    model = load_model()
-    cv_emb = model.encode(cv_text, convert_to_tensor=True)
+    return compute_batch_matches(
+        [cv_text], jobs, threshold=threshold, with_embeddings=with_embeddings
+    )[0]
 
-    results = []
 
-    for job in jobs:
+# ---------------------------------------------------------
+# Batch mode: many CVs against one shared job set
+# ---------------------------------------------------------
 
-        # Use ONLY job description (title is not used for matching)
-        job_desc = job.get("description", "").strip()
+def compute_batch_matches(cv_texts, jobs, threshold=0.30, with_embeddings=False):
+    """
+    Match several CVs against the same job list in one pass.
+
+    All CVs and all job descriptions are encoded once, and the full
+    CV x job cosine similarity matrix is computed in a single call.
+    Returns one list of MatchRecord per CV (same order as cv_texts),
+    each sorted by score, highest first. Matches reference the input
+    job objects and share one snippet per job across CVs.
+
+    With with_embeddings=True every match also carries the job's
+    "embedding" as a float32 numpy vector (shared between CVs, no per-float
+    Python objects), for columnar export.
+    """
 
+    if not cv_texts:
+        return []
+
+    # Use ONLY job description (title is not used for matching)
+    scored_jobs = []
+    job_descs = []
+    for job in jobs:
+        job_desc = job.get("description", "").strip()
         if not job_desc:
             continue
+        scored_jobs.append(job)
+        job_descs.append(job_desc)
 
-        job_emb = model.encode(job_desc, convert_to_tensor=True)
-        sim = util.cos_sim(cv_emb, job_emb).item()
+    if not job_descs:
+        return [[] for _ in cv_texts]
 
-        if sim < threshold:
-            continue
+    model = load_model()
+    cv_embs = model.encode(list(cv_texts), convert_to_tensor=True)
+    job_embs = model.encode(job_descs, convert_to_tensor=True)
+
+    sim_matrix = util.cos_sim(cv_embs, job_embs).tolist()
+    job_vectors = None
+    if with_embeddings:
+        job_vectors = job_embs.cpu().numpy().astype(np.float32, copy=False)
+    snippets = [desc.replace("\n", " ")[:300] for desc in job_descs]
+
+    matched_vectors = {}
+    all_results = []
+
+    for sims in sim_matrix:
+        results = []
+
+        for j, (job, sim) in enumerate(zip(scored_jobs, sims)):
+            if sim < threshold:
+                continue
 
-        score_pct = round(sim * 100, 2)
+            score_pct = round(sim * 100, 2)
+            embedding = None
+            if with_embeddings:
+                # Copy only matched rows, once per job, so the full
+                # matrix (incl. below-threshold jobs) can be freed.
+                if j not in matched_vectors:
+                    matched_vectors[j] = job_vectors[j].copy()
+                embedding = matched_vectors[j]
 
-        snippet = job_desc.replace("\n", " ")[:300]
+            results.append(MatchRecord(job, score_pct, snippets[j], embedding))
 
-        results.append({
-            "title": job.get("title", "Unknown"),
-            "company": job.get("company", "N/A"),
-            "source": job.get("source", "Unknown"),
-            "location": job.get("location", ""),
-            "url": job.get("url", ""),
-            "score": score_pct,
-            "snippet": snippet,
-        })
+        results.sort(key=lambda r: r.score, reverse=True)
+        all_results.append(results)
 
-    return results
+    return all_results
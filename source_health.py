@@ -0,0 +1,179 @@
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Dict
+
+HEALTH_PATH = "source_health.json"
+
+WINDOW = 50  # outcomes kept per source for rates/percentiles
+FAILURE_THRESHOLD = 3  # consecutive failures that open the circuit
+COOLDOWN_SECONDS = 300  # how long an open circuit skips the source
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+# ---------------------------------------------------------
+# Per-source health record
+# ---------------------------------------------------------
+
+class SourceHealth:
+    """Rolling outcomes and circuit-breaker state for one job source."""
+
+    def __init__(self):
+        self.outcomes = deque(maxlen=WINDOW)  # (ok, latency_seconds)
+        self.consecutive_failures = 0
+        self.state = CLOSED
+        self.opened_at = 0.0
+        self.probe_in_flight = False
+        self.last_error = ""
+
+    def success_rate(self):
+        if not self.outcomes:
+            return None
+        return sum(1 for ok, _ in self.outcomes if ok) / len(self.outcomes)
+
+    def latency_percentile(self, pct):
+        latencies = sorted(lat for _, lat in self.outcomes)
+        if not latencies:
+            return None
+        idx = min(len(latencies) - 1, int(round(pct / 100 * (len(latencies) - 1))))
+        return latencies[idx]
+
+    def to_dict(self):
+        return {
+            "outcomes": [list(o) for o in self.outcomes],
+            "consecutive_failures": self.consecutive_failures,
+            "state": self.state,
+            "opened_at": self.opened_at,
+            "last_error": self.last_error,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        health = cls()
+        health.outcomes.extend((bool(ok), float(lat)) for ok, lat in data.get("outcomes", []))
+        health.consecutive_failures = int(data.get("consecutive_failures", 0))
+        health.state = data.get("state", CLOSED)
+        health.opened_at = float(data.get("opened_at", 0.0))
+        health.last_error = data.get("last_error", "")
+        # A probe cannot survive a restart; let the next request re-probe.
+        if health.state == HALF_OPEN:
+            health.state = OPEN
+        return health
+
+
+# ---------------------------------------------------------
+# Registry (loaded lazily, persisted after every outcome)
+# ---------------------------------------------------------
+
+_registry = None
+_lock = threading.Lock()
+
+
+def _load():
+    global _registry
+    if _registry is None:
+        _registry = {}
+        if os.path.exists(HEALTH_PATH):
+            try:
+                with open(HEALTH_PATH, "r", encoding="utf-8") as fh:
+                    for name, data in json.load(fh).items():
+                        _registry[name] = SourceHealth.from_dict(data)
+            except Exception as e:
+                print("Source health load error:", e)
+    return _registry
+
+
+def _get(source):
+    registry = _load()
+    if source not in registry:
+        registry[source] = SourceHealth()
+    return registry[source]
+
+
+def _save():
+    data = {name: h.to_dict() for name, h in _registry.items()}
+    tmp_path = f"{HEALTH_PATH}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as fh:
+            json.dump(data, fh)
+        os.replace(tmp_path, HEALTH_PATH)
+    except Exception as e:
+        print("Source health save error:", e)
+
+
+# ---------------------------------------------------------
+# Circuit breaker API used by data_sources
+# ---------------------------------------------------------
+
+def allow_request(source: str) -> bool:
+    """
+    False while the source's circuit is open. After the cool-down one
+    probe request is let through (half-open); its outcome decides
+    whether the circuit closes again or stays open.
+    """
+    with _lock:
+        health = _get(source)
+
+        if health.state == CLOSED:
+            return True
+
+        if health.state == OPEN:
+            if time.time() - health.opened_at < COOLDOWN_SECONDS:
+                return False
+            health.state = HALF_OPEN
+            health.probe_in_flight = False
+
+        # HALF_OPEN: only one probe at a time
+        if health.probe_in_flight:
+            return False
+        health.probe_in_flight = True
+        return True
+
+
+def record_success(source: str, latency: float):
+    with _lock:
+        health = _get(source)
+        health.outcomes.append((True, latency))
+        health.consecutive_failures = 0
+        health.state = CLOSED
+        health.probe_in_flight = False
+        _save()
+
+
+def record_failure(source: str, latency: float, error: str = ""):
+    with _lock:
+        health = _get(source)
+        health.outcomes.append((False, latency))
+        health.consecutive_failures += 1
+        health.last_error = error[:200]
+        health.probe_in_flight = False
+
+        if health.state == HALF_OPEN or health.consecutive_failures >= FAILURE_THRESHOLD:
+            health.state = OPEN
+            health.opened_at = time.time()
+        _save()
+
+
+def health_snapshot() -> Dict[str, Dict]:
+    """Summary per source for display: state, success rate, p50/p95 latency."""
+    with _lock:
+        snapshot = {}
+        for name, health in sorted(_load().items()):
+            cooldown_left = 0
+            if health.state == OPEN:
+                cooldown_left = max(0, int(COOLDOWN_SECONDS - (time.time() - health.opened_at)))
+            snapshot[name] = {
+                "state": health.state,
+                "success_rate": health.success_rate(),
+                "p50_latency": health.latency_percentile(50),
+                "p95_latency": health.latency_percentile(95),
+                "consecutive_failures": health.consecutive_failures,
+                "cooldown_left": cooldown_left,
+                "last_error": health.last_error,
+            }
+        return snapshot
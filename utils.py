@@ -1,6 +1,13 @@
+import csv
+import io
+import itertools
+import json
+import os
 import re
-import pandas as pd
+import tempfile
 from bs4 import BeautifulSoup
+from PyPDF2 import PdfReader
+from docx import Document
 
 
 # ---------------------------------------------------------
@@ -31,10 +38,39 @@ def make_snippet(text: str, length: int = 300) -> str:
     return text[:length]
 
 
+# ---------------------------------------------------------
+# Extract plain text from an uploaded CV (PDF, DOCX or TXT)
+# ---------------------------------------------------------
+
+def extract_cv_text(data: bytes, filename: str) -> str:
+    """
+    Returns the raw text of a CV file given its bytes and file name.
+    Raises ValueError for unsupported file types.
+    """
+
+    name = filename.lower()
+
+    if name.endswith(".pdf"):
+        reader = PdfReader(io.BytesIO(data))
+        return " ".join([page.extract_text() or "" for page in reader.pages])
+
+    if name.endswith(".docx"):
+        document = Document(io.BytesIO(data))
+        return "\n".join([p.text for p in document.paragraphs])
+
+    if name.endswith(".txt"):
+        return data.decode("utf-8", errors="ignore")
+
+    raise ValueError(f"Unsupported CV file type: {filename}")
+
+
 # ---------------------------------------------------------
 # Convert match results to CSV (as bytes)
 # ---------------------------------------------------------
 
+EXPORT_COLUMNS = ["title", "company", "source", "location", "url", "score", "snippet"]
+
+
 def results_to_csv(results: list) -> bytes:
     """
     Converts a list of job match dictionaries to downloadable CSV bytes.
@@ -43,8 +79,179 @@ def results_to_csv(results: list) -> bytes:
     if not results:
         return b""
 
-    df = pd.DataFrame(results)
-    return df.to_csv(index=False).encode("utf-8")
+    return b"".join(iter_csv_chunks(results))
+
+
+# ---------------------------------------------------------
+# Streaming exports (constant memory, any row count)
+# ---------------------------------------------------------
+
+def _chunked(rows, chunk_rows: int):
+    rows = iter(rows)
+    while True:
+        chunk = list(itertools.islice(rows, chunk_rows))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_csv_chunks(rows, columns: list = None, chunk_rows: int = 500):
+    """
+    Yields CSV bytes for any iterable of dicts, chunk_rows rows at a time.
+    Columns default to the keys of the first row; extra keys are dropped.
+    """
+
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return
+
+    columns = columns or [k for k in first.keys() if k != "embedding"]
+    buf = io.StringIO()
+    writer = csv.DictWriter(
+        buf, fieldnames=columns, extrasaction="ignore", lineterminator="\n"
+    )
+    writer.writeheader()
+
+    for chunk in _chunked(itertools.chain([first], rows), chunk_rows):
+        writer.writerows(chunk)
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate(0)
+
+
+def iter_jsonl_chunks(rows, columns: list = None, chunk_rows: int = 500):
+    """
+    Yields JSON Lines bytes (one object per row), chunk_rows rows at a time.
+    """
+
+    for chunk in _chunked(rows, chunk_rows):
+        lines = []
+        for row in chunk:
+            if columns:
+                row = {k: row.get(k) for k in columns}
+            elif hasattr(row, "to_dict"):
+                row = row.to_dict()
+            lines.append(json.dumps(row, ensure_ascii=False, default=str))
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _open_unlinked(path: str):
+    """Open a temp file for reading and remove its name; data lives until closed."""
+    reader = open(path, "rb")
+    try:
+        os.remove(path)
+    except OSError:
+        pass  # e.g. Windows; left for the OS temp cleanup
+    return reader
+
+
+def spool_chunks(chunks):
+    """
+    Writes byte chunks to a temp file on disk and returns it opened for
+    reading (a BufferedReader, which st.download_button accepts).
+    """
+
+    fd, path = tempfile.mkstemp(prefix="jobhunt-export-")
+    with os.fdopen(fd, "wb") as fh:
+        for chunk in chunks:
+            fh.write(chunk)
+    return _open_unlinked(path)
+
+
+def spool_columnar(rows, fmt: str = "parquet"):
+    """Like spool_chunks, but for a Parquet/Feather export of rows."""
+
+    fd, path = tempfile.mkstemp(prefix="jobhunt-export-", suffix=f".{fmt}")
+    os.close(fd)
+    try:
+        export_columnar(rows, path, fmt=fmt)
+    except Exception:
+        os.remove(path)
+        raise
+    return _open_unlinked(path)
+
+
+def export_columnar(
+    rows, path: str, fmt: str = "parquet", chunk_rows: int = 1000, schema=None
+) -> int:
+    """
+    Writes rows (jobs, scores and, if present, "embedding" vectors) to a
+    Parquet or Feather file, one record batch per chunk_rows rows.
+    Pass a pyarrow schema for rows other than match results; otherwise
+    EXPORT_COLUMNS (+ embedding) use fixed types and other columns are
+    inferred from the first chunk. Returns the number of rows written.
+    """
+
+    try:
+        import numpy as np
+        import pyarrow as pa
+        import pyarrow.ipc as ipc
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError("pyarrow is required for Parquet/Feather export.")
+
+    if fmt not in ("parquet", "feather"):
+        raise ValueError(f"Unsupported columnar format: {fmt}")
+
+    known_types = {k: pa.string() for k in EXPORT_COLUMNS}
+    known_types["score"] = pa.float64()
+    known_types["embedding"] = pa.list_(pa.float32())
+
+    def _column(name, values):
+        if name == "embedding":
+            # float32 vectors (numpy rows) -> one flat buffer plus offsets
+            vectors = [np.asarray(v, dtype=np.float32) for v in values]
+            offsets = np.zeros(len(vectors) + 1, dtype=np.int32)
+            np.cumsum([len(v) for v in vectors], out=offsets[1:])
+            flat = np.concatenate(vectors) if vectors else np.zeros(0, np.float32)
+            return pa.ListArray.from_arrays(pa.array(offsets), pa.array(flat))
+        return pa.array(values, type=schema.field(name).type)
+
+    writer = None
+    written = 0
+
+    try:
+        for chunk in _chunked(rows, chunk_rows):
+            if schema is None:
+                fields = []
+                for key in chunk[0].keys():
+                    col_type = known_types.get(key)
+                    if col_type is None:
+                        col_type = pa.array([row.get(key) for row in chunk]).type
+                        if pa.types.is_null(col_type):
+                            col_type = pa.string()
+                    fields.append(pa.field(key, col_type))
+                schema = pa.schema(fields)
+
+            if writer is None:
+                writer = _columnar_writer(pq, ipc, path, schema, fmt)
+
+            batch = pa.RecordBatch.from_arrays(
+                [_column(name, [row.get(name) for row in chunk]) for name in schema.names],
+                schema=schema,
+            )
+            writer.write_batch(batch)
+            written += len(chunk)
+
+        # No rows: still write a valid, empty file with the same layout.
+        if writer is None:
+            if schema is None:
+                schema = pa.schema(
+                    [pa.field(k, known_types[k]) for k in EXPORT_COLUMNS + ["embedding"]]
+                )
+            writer = _columnar_writer(pq, ipc, path, schema, fmt)
+    finally:
+        if writer is not None:
+            writer.close()
+
+    return written
+
+
+def _columnar_writer(pq, ipc, path, schema, fmt):
+    if fmt == "parquet":
+        return pq.ParquetWriter(path, schema)
+    return ipc.new_file(path, schema)
 
 
 # ---------------------------------------------------------